@@ -51,12 +51,20 @@ class Config:
     CURRENT_ENV = os.getenv('TEST_ENV', 'dev')
     config = ENVIRONMENTS[CURRENT_ENV]
     
+    # pytest-xdist worker id ('gw0', 'gw1', ...) or '' when running serially
+    XDIST_WORKER = os.getenv('PYTEST_XDIST_WORKER', '')
+
     # Environment properties
     BASE_URL = config.base_url
     IMPLICIT_WAIT = config.implicit_wait
     EXPLICIT_WAIT = config.explicit_wait
     PAGE_LOAD_TIMEOUT = config.page_load_timeout
-    SCREENSHOT_DIR = config.screenshot_dir
+    # Write screenshots under a worker-suffixed subdirectory so parallel
+    # workers never contend on the same files
+    SCREENSHOT_DIR = (
+        os.path.join(config.screenshot_dir, XDIST_WORKER)
+        if XDIST_WORKER else config.screenshot_dir
+    )
     REPORT_DIR = config.report_dir
     ALLURE_RESULTS_DIR = config.allure_results_dir
     BROWSER = config.browser
@@ -79,6 +87,10 @@ class Config:
             'CI Mode': str(cls.CI_MODE)
         }
 
+    # Block images/fonts/analytics during tests to cut page weight; set
+    # BLOCK_IMAGES=false for tests that need real rendering
+    BLOCK_IMAGES = os.getenv('BLOCK_IMAGES', 'true').lower() == 'true'
+
     # Test credentials
     TEST_USERNAME: str = "Admin"
     TEST_PASSWORD: str = "admin123"
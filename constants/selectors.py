@@ -2,7 +2,6 @@
 CSS selectors for web elements.
 """
 from dataclasses import dataclass
-from typing import Dict
 
 @dataclass
 class LoginPageSelectors:
@@ -16,14 +15,10 @@ class LoginPageSelectors:
     USER_DROPDOWN: str = ".oxd-userdropdown-tab"
     LOGOUT_LINK: str = "a[href*='logout']"
 
+@dataclass
 class DashboardPageSelectors:
     """Selectors for the dashboard page."""
-    
-    WELCOME_MESSAGE = {'type': 'css', 'value': '.oxd-userdropdown-name, .oxd-userdropdown-tab'}
-    USER_DROPDOWN = {'type': 'css', 'value': '.oxd-userdropdown-tab'}
-    LOGOUT_LINK = {'type': 'css', 'value': 'a[href="/web/index.php/auth/logout"]'}
-    
-    MENU_ITEMS: Dict[str, str] = {
-        "type": "css",
-        "value": ".oxd-main-menu-item"
-    } 
\ No newline at end of file
+    WELCOME_MESSAGE: str = ".oxd-userdropdown-name, .oxd-userdropdown-tab"
+    USER_DROPDOWN: str = ".oxd-userdropdown-tab"
+    LOGOUT_LINK: str = "a[href='/web/index.php/auth/logout']"
+    MENU_ITEMS: str = ".oxd-main-menu-item" 
\ No newline at end of file
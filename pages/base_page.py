@@ -23,7 +23,30 @@ class BasePage:
             driver: WebDriver instance
         """
         self.driver = driver
-    
+        self._element_cache = {}
+
+    def cached(self, selector: str) -> WebElement:
+        """
+        Find an element, reusing a previously located instance if available.
+
+        Avoids re-running the locator for every step of a multi-action
+        flow on the same page. The cache must be cleared on navigation
+        (see clear_element_cache) since cached references go stale.
+
+        Args:
+            selector: CSS selector string
+
+        Returns:
+            WebElement: Found element
+        """
+        if selector not in self._element_cache:
+            self._element_cache[selector] = self.find_element(selector)
+        return self._element_cache[selector]
+
+    def clear_element_cache(self) -> None:
+        """Drop cached element references (call after any navigation)."""
+        self._element_cache.clear()
+
     def find_element(self, selector: str, timeout: Optional[int] = None) -> WebElement:
         """
         Find an element using the provided selector.
@@ -41,19 +64,19 @@ class BasePage:
         try:
             wait = WebDriverWait(self.driver, timeout or Config.EXPLICIT_WAIT)
             
-            logger.debug(f"Waiting for element: {selector}")
+            logger.debug("Waiting for element: %s", selector)
             element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selector)))
-            logger.debug(f"Found element: {selector}")
+            logger.debug("Found element: %s", selector)
             
             return element
             
         except TimeoutException as e:
-            logger.error(f"Element not found: {selector}")
-            logger.debug(f"Current URL: {self.driver.current_url}")
-            logger.debug(f"Page source: {self.driver.page_source[:500]}...")
+            logger.error("Element not found: %s", selector)
+            logger.debug("Current URL: %s", self.driver.current_url)
+            logger.debug("Page source: %.500s...", self.driver.page_source)
             raise
         except Exception as e:
-            logger.error(f"Error finding element {selector}: {str(e)}")
+            logger.error("Error finding element %s: %s", selector, str(e))
             raise
     
     def find_elements(self, selector: str, timeout: Optional[int] = None) -> List[WebElement]:
@@ -70,17 +93,17 @@ class BasePage:
         try:
             wait = WebDriverWait(self.driver, timeout or Config.EXPLICIT_WAIT)
             
-            logger.debug(f"Waiting for elements: {selector}")
+            logger.debug("Waiting for elements: %s", selector)
             elements = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)))
-            logger.debug(f"Found {len(elements)} elements: {selector}")
+            logger.debug("Found %d elements: %s", len(elements), selector)
             
             return elements
             
         except TimeoutException as e:
-            logger.error(f"Elements not found: {selector}")
+            logger.error("Elements not found: %s", selector)
             return []
         except Exception as e:
-            logger.error(f"Error finding elements {selector}: {str(e)}")
+            logger.error("Error finding elements %s: %s", selector, str(e))
             return []
     
     def wait_for_element_to_be_clickable(self, selector: str, timeout: Optional[int] = None) -> WebElement:
@@ -97,17 +120,17 @@ class BasePage:
         try:
             wait = WebDriverWait(self.driver, timeout or Config.EXPLICIT_WAIT)
             
-            logger.debug(f"Waiting for element to be clickable: {selector}")
+            logger.debug("Waiting for element to be clickable: %s", selector)
             element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-            logger.debug(f"Element is clickable: {selector}")
+            logger.debug("Element is clickable: %s", selector)
             
             return element
             
         except TimeoutException as e:
-            logger.error(f"Element not clickable: {selector}")
+            logger.error("Element not clickable: %s", selector)
             raise
         except Exception as e:
-            logger.error(f"Error waiting for element to be clickable {selector}: {str(e)}")
+            logger.error("Error waiting for element to be clickable %s: %s", selector, str(e))
             raise
     
     def is_element_present(self, selector: str, timeout: Optional[int] = None) -> bool:
@@ -127,7 +150,7 @@ class BasePage:
         except (TimeoutException, NoSuchElementException):
             return False
         except Exception as e:
-            logger.error(f"Error checking element presence {selector}: {str(e)}")
+            logger.error("Error checking element presence %s: %s", selector, str(e))
             return False
     
     def get_text(self, selector: str) -> str:
@@ -143,10 +166,10 @@ class BasePage:
         try:
             element = self.find_element(selector)
             text = element.text
-            logger.debug(f"Got text from element {selector}: {text}")
+            logger.debug("Got text from element %s: %s", selector, text)
             return text
         except Exception as e:
-            logger.error(f"Error getting text from element {selector}: {str(e)}")
+            logger.error("Error getting text from element %s: %s", selector, str(e))
             return ""
     
     def input_text(self, selector: str, text: str) -> None:
@@ -161,9 +184,9 @@ class BasePage:
             element = self.find_element(selector)
             element.clear()
             element.send_keys(text)
-            logger.debug(f"Input text into element {selector}: {text}")
+            logger.debug("Input text into element %s: %s", selector, text)
         except Exception as e:
-            logger.error(f"Error inputting text into element {selector}: {str(e)}")
+            logger.error("Error inputting text into element %s: %s", selector, str(e))
             raise
     
     def click(self, selector: str) -> None:
@@ -176,9 +199,9 @@ class BasePage:
         try:
             element = self.wait_for_element_to_be_clickable(selector)
             element.click()
-            logger.debug(f"Clicked element: {selector}")
+            logger.debug("Clicked element: %s", selector)
         except Exception as e:
-            logger.error(f"Error clicking element {selector}: {str(e)}")
+            logger.error("Error clicking element %s: %s", selector, str(e))
             raise
     
     def take_screenshot(self, name: Optional[str] = None) -> str:
@@ -199,5 +222,5 @@ class BasePage:
         filepath = os.path.join(Config.SCREENSHOT_DIR, filename)
         
         self.driver.save_screenshot(filepath)
-        logger.info(f"Screenshot saved: {filepath}")
+        logger.info("Screenshot saved: %s", filepath)
         return filepath 
\ No newline at end of file
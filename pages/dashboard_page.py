@@ -2,6 +2,7 @@
 Dashboard page object for OrangeHRM.
 """
 from typing import List, Optional
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from pages.base_page import BasePage
@@ -32,18 +33,18 @@ class DashboardPage(BasePage):
     def logout(self) -> None:
         """Perform logout action."""
         self.click(self.selectors.USER_DROPDOWN)
-        self.click(self.selectors.LOGOUT_BUTTON)
-    
+        self.click(self.selectors.LOGOUT_LINK)
+
     def get_menu_items(self) -> List[str]:
         """
         Get list of menu items.
-        
+
         Returns:
             List of menu item texts
         """
         elements = self.driver.find_elements(
             By.CSS_SELECTOR,
-            self.selectors.MENU_ITEMS["value"]
+            self.selectors.MENU_ITEMS
         )
         return [element.text for element in elements]
     
@@ -1,11 +1,10 @@
 """
 Login page object for OrangeHRM.
 """
-from typing import Optional
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 
 from pages.base_page import BasePage
@@ -15,42 +14,95 @@ from utils.logger import logger
 
 class LoginPage(BasePage):
     """Login page object for OrangeHRM."""
-    
+
+    # Collects error message, required-field error and dashboard presence in
+    # a single round trip instead of three separate find_element calls
+    _LOGIN_STATE_SCRIPT = (
+        "return {"
+        "err: document.querySelector(arguments[0])?.innerText || '', "
+        "req: document.querySelector(arguments[1])?.innerText || '', "
+        "dash: !!document.querySelector(arguments[2])"
+        "};"
+    )
+
     def __init__(self, driver: WebDriver):
         """
         Initialize the login page.
-        
+
         Args:
             driver: WebDriver instance
         """
         super().__init__(driver)
         self.url = Config.BASE_URL
         self.selectors = LoginPageSelectors
-    
+        self._wait = WebDriverWait(driver, Config.IMPLICIT_WAIT)
+
+    def _get_login_state(self) -> dict:
+        """
+        Get error/required/dashboard state of the page in one script call.
+
+        Returns:
+            dict: {'err': str, 'req': str, 'dash': bool}
+        """
+        return self.driver.execute_script(
+            self._LOGIN_STATE_SCRIPT,
+            LoginPageSelectors.ERROR_MESSAGE,
+            LoginPageSelectors.REQUIRED_ERROR,
+            LoginPageSelectors.DASHBOARD,
+        )
+
     def navigate(self) -> None:
         """Navigate to the login page."""
         try:
-            logger.info(f"Navigating to {self.url}")
+            logger.info("Navigating to %s", self.url)
+            # Drop any authenticated session up front; the server then
+            # serves the login page directly, so the two-click UI logout
+            # flow for the "already logged in" case is never needed
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
             self.driver.get(self.url)
-            
+            self.clear_element_cache()
+
             # Wait for login form to be present
-            WebDriverWait(self.driver, Config.IMPLICIT_WAIT).until(
+            self._wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, LoginPageSelectors.USERNAME))
             )
             logger.info("Login page loaded successfully")
-            
-            # Check if already logged in
-            if "/dashboard/index" in self.driver.current_url:
-                logger.info("User already logged in, attempting to logout")
-                self.logout()
-                
+
         except TimeoutException:
             logger.error("Timeout waiting for login page to load")
             raise
         except Exception as e:
-            logger.error(f"Failed to navigate to login page: {str(e)}")
+            logger.error("Failed to navigate to login page: %s", str(e))
             raise
-    
+
+    def reset_to_login(self) -> None:
+        """
+        Return the browser to a clean login page between tests.
+
+        Same end state as navigate(), but the navigation is issued over
+        CDP (Page.navigate) instead of the W3C driver.get() endpoint;
+        the CDP command returns without blocking on the page-load
+        strategy, so the only wait is the explicit one for the login
+        form.
+        """
+        try:
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            self.driver.execute_cdp_cmd("Page.navigate", {"url": self.url})
+            self.clear_element_cache()
+
+            self._wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, LoginPageSelectors.USERNAME))
+            )
+            logger.debug("Reset browser to login page")
+
+        except TimeoutException:
+            logger.error("Timeout waiting for login page after reset")
+            raise
+        except Exception as e:
+            logger.error("Failed to reset to login page: %s", str(e))
+            raise
+
+
     def login(self, username: str, password: str) -> None:
         """
         Login with given credentials.
@@ -60,62 +112,101 @@ class LoginPage(BasePage):
             password: Password to login with
         """
         try:
-            # Input username
-            self.input_text(LoginPageSelectors.USERNAME, username)
-            logger.info(f"Entered username: {username}")
-            
-            # Input password
-            self.input_text(LoginPageSelectors.PASSWORD, password)
-            logger.info("Entered password")
-            
-            # Click login button
-            self.click_login_button()
-            
+            # Cached lookups locate each element once for the whole flow
+            username_field = self.cached(LoginPageSelectors.USERNAME)
+            username_field.clear()
+            username_field.send_keys(username)
+            logger.debug("Entered username: %s", username)
+
+            password_field = self.cached(LoginPageSelectors.PASSWORD)
+            password_field.clear()
+            password_field.send_keys(password)
+            logger.debug("Entered password")
+
+            self.cached(LoginPageSelectors.LOGIN_BUTTON).click()
+            logger.debug("Clicked login button")
+
         except Exception as e:
-            logger.error(f"Login failed: {str(e)}")
+            logger.error("Login failed: %s", str(e))
             raise
     
+    # Fills both fields and submits the form in one round trip; the input
+    # events keep the page's form framework in sync with the new values
+    _LOGIN_SCRIPT = (
+        "const u = document.querySelector(arguments[0]);"
+        "const p = document.querySelector(arguments[1]);"
+        "const b = document.querySelector(arguments[2]);"
+        "u.value = arguments[3];"
+        "u.dispatchEvent(new Event('input', {bubbles: true}));"
+        "p.value = arguments[4];"
+        "p.dispatchEvent(new Event('input', {bubbles: true}));"
+        "b.click();"
+    )
+
+    def login_fast(self, username: str, password: str) -> None:
+        """
+        Login with given credentials using a single script call.
+
+        Collapses the separate clear/send_keys/click WebDriver commands of
+        login() into one execute_script round trip. Use login() when real
+        key events matter (e.g. field-change handler coverage).
+
+        Args:
+            username: Username to login with
+            password: Password to login with
+        """
+        try:
+            self.driver.execute_script(
+                self._LOGIN_SCRIPT,
+                LoginPageSelectors.USERNAME,
+                LoginPageSelectors.PASSWORD,
+                LoginPageSelectors.LOGIN_BUTTON,
+                username,
+                password,
+            )
+            logger.debug("Submitted login form for user: %s", username)
+        except Exception as e:
+            logger.error("Fast login failed: %s", str(e))
+            raise
+
     def click_login_button(self) -> None:
         """Click the login button."""
         try:
             self.click(LoginPageSelectors.LOGIN_BUTTON)
-            logger.info("Clicked login button")
+            logger.debug("Clicked login button")
         except Exception as e:
-            logger.error(f"Failed to click login button: {str(e)}")
+            logger.error("Failed to click login button: %s", str(e))
             raise
     
-    def get_error_message(self) -> str:
+    def get_error_message(self, timeout: float = 0) -> str:
         """
         Get the error message if present.
-        
+
+        With the default timeout of 0 this is a single sub-millisecond
+        script call that returns immediately when no error exists - no
+        find_element round trip and no polling.
+
+        Args:
+            timeout: Seconds to poll for an error before giving up
+
         Returns:
             str: Error message text or empty string if no error
         """
+        state = self._get_login_state()
+        if state['err'] or state['req'] or not timeout:
+            return (state['err'] or state['req']).strip()
+
         try:
-            # Wait for either error message type to be present
-            WebDriverWait(self.driver, Config.IMPLICIT_WAIT).until(
-                lambda driver: len(driver.find_elements(By.CSS_SELECTOR, LoginPageSelectors.ERROR_MESSAGE)) > 0 or
-                             len(driver.find_elements(By.CSS_SELECTOR, LoginPageSelectors.REQUIRED_ERROR)) > 0
+            state = WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: (lambda s: s if s['err'] or s['req'] else None)(
+                    self._get_login_state()
+                )
             )
-            
-            # Check for general error message
-            error_elements = self.driver.find_elements(By.CSS_SELECTOR, LoginPageSelectors.ERROR_MESSAGE)
-            if error_elements:
-                return error_elements[0].text.strip()
-            
-            # Check for required field error
-            required_elements = self.driver.find_elements(By.CSS_SELECTOR, LoginPageSelectors.REQUIRED_ERROR)
-            if required_elements:
-                return required_elements[0].text.strip()
-            
-            return ""
-            
+            return (state['err'] or state['req']).strip()
+
         except TimeoutException:
             logger.debug("No error message found within timeout period")
             return ""
-        except Exception as e:
-            logger.error(f"Failed to get error message: {str(e)}")
-            return ""
     
     def is_login_successful(self) -> bool:
         """
@@ -125,19 +216,16 @@ class LoginPage(BasePage):
             bool: True if login was successful, False otherwise
         """
         try:
-            # Wait for URL to change to dashboard
-            WebDriverWait(self.driver, Config.IMPLICIT_WAIT).until(
-                lambda driver: "/dashboard/index" in driver.current_url
-            )
-            
-            # Check for dashboard element
-            dashboard = self.find_element(LoginPageSelectors.DASHBOARD)
-            return bool(dashboard)
-            
-        except (TimeoutException, NoSuchElementException):
+            # Post-login OrangeHRM redirects to /dashboard/index, so the
+            # URL alone answers the question - one W3C command per poll
+            # with no DOM probing
+            self._wait.until(EC.url_contains("/dashboard/index"))
+            return True
+
+        except TimeoutException:
             return False
         except Exception as e:
-            logger.error(f"Failed to check login status: {str(e)}")
+            logger.error("Failed to check login status: %s", str(e))
             return False
     
     def logout(self) -> None:
@@ -145,12 +233,12 @@ class LoginPage(BasePage):
         try:
             # Click user dropdown
             self.click(LoginPageSelectors.USER_DROPDOWN)
-            logger.info("Clicked user dropdown")
+            logger.debug("Clicked user dropdown")
             
             # Click logout link
             self.click(LoginPageSelectors.LOGOUT_LINK)
-            logger.info("Clicked logout link")
+            logger.debug("Clicked logout link")
             
         except Exception as e:
-            logger.error(f"Logout failed: {str(e)}")
+            logger.error("Logout failed: %s", str(e))
             raise 
\ No newline at end of file
@@ -4,17 +4,17 @@ PyTest fixtures for the test framework.
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 import logging
 import os
 import allure
 from selenium.webdriver.remote.webdriver import WebDriver
-from datetime import datetime
 
-from utils.driver_manager import DriverManager
-from utils.logger import logger
+from utils.driver_manager import (
+    _new_chrome_options,
+    _BLOCKED_URL_PATTERNS,
+    get_chrome_driver_path,
+)
+from utils.driver_pool import DriverPool
 from config.config import Config
 
 # Configure logging
@@ -23,69 +23,191 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Skip thread/process introspection when building log records; the extra
+# lookups add up across the per-action logs emitted by page objects
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 def write_allure_environment():
+    # Under pytest-xdist every worker runs pytest_sessionstart; only one
+    # process needs to write the (identical) environment.properties file
+    if Config.XDIST_WORKER not in ('', 'gw0'):
+        return
     env = Config.get_allure_environment_properties()
+    content = "".join(f"{k}={v}\n" for k, v in env.items())
+    path = os.path.join(Config.ALLURE_RESULTS_DIR, "environment.properties")
+
+    # Skip the rewrite when the file already holds the same content
+    # (e.g. repeated watch-mode runs)
+    try:
+        with open(path) as f:
+            if f.read() == content:
+                return
+    except OSError:
+        pass
+
     os.makedirs(Config.ALLURE_RESULTS_DIR, exist_ok=True)
-    with open(os.path.join(Config.ALLURE_RESULTS_DIR, "environment.properties"), "w") as f:
-        for k, v in env.items():
-            f.write(f"{k}={v}\n")
+    with open(path, "w") as f:
+        f.write(content)
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--screenshot-policy",
+        choices=("always", "failure", "never"),
+        default="failure",
+        help="When to attach screenshots to Allure results: on every test, "
+             "only on failure (default), or never. 'never' keeps the "
+             "results directory free of PNG traffic entirely.",
+    )
+
+def pytest_configure(config):
+    # Resolve the current run's log file once per session; the old
+    # setup/teardown code rescanned logs/ and re-read the whole file
+    # twice per test method
+    import glob
+    log_files = glob.glob('logs/test_run_*.log')
+    config._current_log_path = (
+        max(log_files, key=os.path.getctime) if log_files else None
+    )
 
 # Pytest hook to write environment.properties before session starts
 @pytest.hookimpl(tryfirst=True)
 def pytest_sessionstart(session):
     write_allure_environment()
+    # Create the screenshot directory once per session for anything that
+    # persists screenshots to disk (e.g. BasePage.take_screenshot)
+    if os.environ.get('SAVE_SCREENSHOTS'):
+        os.makedirs(Config.SCREENSHOT_DIR, exist_ok=True)
+
+def _create_session_chrome() -> WebDriver:
+    """
+    Create the Chrome instance used by the session driver pool.
+
+    Returns:
+        WebDriver: Configured Chrome WebDriver instance
+    """
+    # Base arguments, startup-suppression flags and the eager page-load
+    # strategy come from the shared helper in utils.driver_manager, so
+    # the pooled and DriverManager-built drivers cannot drift apart
+    chrome_options = _new_chrome_options(
+        headless=os.environ.get('GITHUB_ACTIONS') == 'true'
+    )
+
+    # Pool-specific extras: fixed window size, and incognito for
+    # per-session isolation without the disk I/O of scaffolding a fresh
+    # --user-data-dir profile on every run
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--incognito')
+
+    if Config.BLOCK_IMAGES:
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+
+    # Use a pinned local driver when one exists; otherwise let Selenium
+    # Manager resolve it from its own on-disk cache
+    driver_path = get_chrome_driver_path()
+    if driver_path:
+        driver = webdriver.Chrome(
+            service=ChromeService(driver_path), options=chrome_options
+        )
+    else:
+        driver = webdriver.Chrome(options=chrome_options)
+
+    # The tests only need the page's HTML structure; blocking images,
+    # fonts and analytics cuts most of the bytes per navigation
+    if Config.BLOCK_IMAGES:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)}
+        )
+    # No implicit wait: mixing implicit and explicit waits multiplies
+    # timeouts; page objects rely on targeted WebDriverWait calls instead
+    driver.implicitly_wait(0)
+
+    return driver
 
 @pytest.fixture(scope="session")
-def browser() -> WebDriver:
+def driver_pool() -> DriverPool:
     """
-    Create and configure a WebDriver instance.
-    
+    Session-scoped pool of Chrome drivers.
+
+    Browsers are started once per session and reused by every test;
+    DRIVER_POOL_SIZE caps how many Chrome processes run concurrently
+    per worker (default 1).
+
     Returns:
-        WebDriver: Configured WebDriver instance
+        DriverPool: The shared driver pool
     """
-    driver = None
+    pool = DriverPool(
+        size=int(os.environ.get('DRIVER_POOL_SIZE', '1')),
+        factory=_create_session_chrome,
+    )
+    try:
+        yield pool
+    finally:
+        pool.shutdown()
+
+@pytest.fixture
+def shared_driver(driver_pool: DriverPool) -> WebDriver:
+    """
+    Borrow a Chrome driver from the session pool for one test.
+
+    The pool resets cookies and per-origin storage on release, so each
+    borrower starts from a clean slate without a browser restart.
+
+    Returns:
+        WebDriver: A pooled Chrome WebDriver instance
+    """
+    driver = driver_pool.acquire()
     try:
-        driver = DriverManager.create_driver()
-        logger.info("Browser started")
         yield driver
     finally:
-        if driver:
-            driver.quit()
-            logger.info("Browser closed")
+        driver_pool.release(driver)
 
-@pytest.fixture(autouse=True)
-def clear_cookies(browser: WebDriver) -> None:
-    """Clear cookies before each test."""
-    browser.delete_all_cookies()
-    logger.debug("Cleared browser cookies")
+@pytest.fixture(scope="session")
+def test_data() -> dict:
+    """
+    Load login test data once per session.
+
+    Returns:
+        dict: Parsed contents of login_test_data.json
+    """
+    import json
+    from pathlib import Path
+
+    test_data_path = Path(__file__).parent.parent / 'test_data' / 'login_test_data.json'
+    with open(test_data_path) as f:
+        return json.load(f)
 
 @pytest.fixture(scope="function")
-def login_page(browser):
+def login_page(shared_driver):
     """
     Fixture to create login page object.
-    
+
     Args:
-        browser: WebDriver instance from browser fixture
-        
+        shared_driver: Pooled WebDriver instance
+
     Returns:
         LoginPage instance
     """
     from pages.login_page import LoginPage
-    return LoginPage(browser)
+    return LoginPage(shared_driver)
 
 @pytest.fixture(scope="function")
-def dashboard_page(browser):
+def dashboard_page(shared_driver):
     """
     Fixture to create dashboard page object.
-    
+
     Args:
-        browser: WebDriver instance from browser fixture
-        
+        shared_driver: Pooled WebDriver instance
+
     Returns:
         DashboardPage instance
     """
     from pages.dashboard_page import DashboardPage
-    return DashboardPage(browser)
+    return DashboardPage(shared_driver)
 
 @pytest.fixture(scope="function")
 def logged_in_user(login_page, dashboard_page):
@@ -104,25 +226,45 @@ def logged_in_user(login_page, dashboard_page):
     assert dashboard_page.is_user_logged_in(), "Login failed"
     return dashboard_page
 
-def _get_page_object_from_request(item):
-    # Try to get a page object from the test function's arguments
-    for arg in item.funcargs.values():
-        if hasattr(arg, 'driver') and hasattr(arg, 'take_screenshot'):
-            return arg
-    return None
+def _get_driver_from_item(item):
+    # Fixture-injected driver first, then BaseTest-style instance attribute
+    funcargs = getattr(item, 'funcargs', {})
+    if 'shared_driver' in funcargs:
+        return funcargs['shared_driver']
+    return getattr(getattr(item, 'instance', None), 'driver', None)
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     # Execute all other hooks to obtain the report object
     outcome = yield
     rep = outcome.get_result()
+    if rep.when == 'call':
+        policy = item.config.getoption("--screenshot-policy")
+        # Screenshots attach straight from memory; with the default
+        # 'failure' policy passing tests produce no screenshot traffic
+        if policy == "always" or (policy == "failure" and rep.failed):
+            driver = _get_driver_from_item(item)
+            if driver:
+                try:
+                    allure.attach(
+                        driver.get_screenshot_as_png(),
+                        name=item.name,
+                        attachment_type=allure.attachment_type.PNG
+                    )
+                except Exception as e:
+                    logging.error(f"Failed to attach screenshot to Allure: {e}")
+
     if rep.when == 'call' and rep.failed:
-        page = _get_page_object_from_request(item)
-        if page:
-            screenshot_path = page.take_screenshot(item.name)
-            # Attach to Allure if available
+        # Attach the tail of the current run's log for context
+        log_path = getattr(item.config, '_current_log_path', None)
+        if log_path:
             try:
-                with open(screenshot_path, 'rb') as f:
-                    allure.attach(f.read(), name=item.name, attachment_type=allure.attachment_type.PNG)
+                with open(log_path, 'rb') as f:
+                    tail = f.read()[-64 * 1024:]
+                allure.attach(
+                    tail,
+                    name="test_log",
+                    attachment_type=allure.attachment_type.TEXT
+                )
             except Exception as e:
-                logging.error(f"Failed to attach screenshot to Allure: {e}") 
\ No newline at end of file
+                logging.error(f"Failed to attach log to Allure: {e}") 
\ No newline at end of file
@@ -3,18 +3,9 @@ Test cases for login functionality.
 """
 import pytest
 import allure
-import json
-from pathlib import Path
-from datetime import datetime
-import os
-import glob
-import tempfile
 
 from tests.base_test import BaseTest
 from pages.login_page import LoginPage
-from utils.logger import logger
-from config.config import Config
-from selenium.webdriver.chrome.options import Options
 
 @allure.epic('OrangeHRM')
 @allure.feature('Authentication')
@@ -34,58 +25,21 @@ This test suite verifies the login functionality of OrangeHRM application.
 """)
 class TestLogin(BaseTest):
     """Test cases for login functionality."""
-    
-    def setup_method(self, method):
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, _attach_driver, test_data):
         """
-        Setup for each test method.
-        
-        Args:
-            method: The test method being called
+        Per-test setup: test data plus a clean login page.
+
+        Depends on BaseTest._attach_driver so the pooled driver is
+        already on the instance; test data comes from the session-scoped
+        test_data fixture, so the JSON is parsed once per run rather
+        than once per test the way setup_method had to.
         """
-        # Call parent setup_method first
-        super().setup_method(method)
-        
-        # Initialize login page
+        self.test_data = test_data
         self.login_page = LoginPage(self.driver)
-        self.login_page.navigate()
-        
-        # Load test data
-        test_data_path = Path(__file__).parent.parent / 'test_data' / 'login_test_data.json'
-        with open(test_data_path) as f:
-            self.test_data = json.load(f)
-            
-        # Add environment info to Allure
-        allure.dynamic.parameter('Browser', Config.BROWSER)
-        allure.dynamic.parameter('Environment', Config.CURRENT_ENV)
-        allure.dynamic.parameter('Base URL', Config.BASE_URL)
-        
-        # Attach current log file to Allure report
-        log_files = glob.glob('logs/test_run_*.log')
-        if log_files:
-            latest_log = max(log_files, key=os.path.getctime)
-            with open(latest_log, 'r') as f:
-                allure.attach(
-                    f.read(),
-                    name="test_log",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-    
-    def teardown_method(self, method):
-        """Teardown for each test method."""
-        # Attach final log file to Allure report
-        log_files = glob.glob('logs/test_run_*.log')
-        if log_files:
-            latest_log = max(log_files, key=os.path.getctime)
-            with open(latest_log, 'r') as f:
-                allure.attach(
-                    f.read(),
-                    name="test_log_final",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-        
-        # Call parent teardown_method
-        super().teardown_method(method)
-    
+        self.login_page.reset_to_login()
+
     @allure.story('Valid Login')
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.description("""
@@ -106,33 +60,66 @@ class TestLogin(BaseTest):
     """)
     def test_valid_login(self):
         """Test valid login with correct credentials."""
-        with allure.step("Navigate to login page"):
-            self.login_page.navigate()
-            allure.attach(
-                self.driver.get_screenshot_as_png(),
-                name="login_page",
-                attachment_type=allure.attachment_type.PNG
-            )
-        
-        with allure.step("Enter valid credentials"):
-            self.login_page.login(
-                self.test_data['valid_credentials']['username'],
-                self.test_data['valid_credentials']['password']
-            )
-            allure.attach(
-                self.driver.get_screenshot_as_png(),
-                name="credentials_entered",
-                attachment_type=allure.attachment_type.PNG
-            )
-        
+        # Navigation already happened in setup; only the assertion gets
+        # its own Allure step
+        self.login_page.login(
+            self.test_data['valid_credentials']['username'],
+            self.test_data['valid_credentials']['password']
+        )
+
         with allure.step("Verify successful login"):
             assert self.login_page.is_login_successful(), "Login was not successful"
-            allure.attach(
-                self.driver.get_screenshot_as_png(),
-                name="login_successful",
-                attachment_type=allure.attachment_type.PNG
+
+    @pytest.fixture
+    def invalid_creds(self, request, test_data):
+        """Resolve an invalid-credentials entry for indirect parametrization."""
+        return test_data['invalid_credentials'][request.param]
+
+    @allure.story('Invalid Login')
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.description("""
+    # Invalid Login Test
+
+    ## Test Objective:
+    Verify that login fails with the expected error for invalid credentials.
+
+    ## Test Steps:
+    1. Navigate to login page
+    2. Submit invalid credentials
+    3. Verify the error message
+
+    ## Expected Result:
+    User stays on the login page and the expected error is shown.
+    """)
+    @pytest.mark.parametrize(
+        "invalid_creds,expected_error",
+        [
+            pytest.param("invalid_username", "Invalid credentials", id="invalid_username"),
+            pytest.param("invalid_password", "Invalid credentials", id="invalid_password"),
+            pytest.param("blank_fields", "Required", id="blank_fields"),
+            pytest.param("case_sensitive", "Invalid credentials", id="case_sensitive"),
+            pytest.param("special_chars", "Invalid credentials", id="special_chars"),
+            pytest.param("long_input", "Invalid credentials", id="long_input"),
+        ],
+        indirect=["invalid_creds"],
+    )
+    def test_invalid_login(self, invalid_creds, expected_error):
+        """Test login failure with invalid credentials."""
+        # Negative cases only care about the server's response, so the
+        # single-round-trip JS submission replaces the full key-event
+        # sequence; test_valid_login keeps real key events for coverage
+        # of the field-change handlers
+        self.login_page.login_fast(
+            invalid_creds['username'],
+            invalid_creds['password']
+        )
+
+        with allure.step("Verify error message"):
+            error = self.login_page.get_error_message(timeout=5)
+            assert expected_error in error, (
+                f"Expected error '{expected_error}', got '{error}'"
             )
-    
+
     @allure.story('Logout')
     @allure.severity(allure.severity_level.NORMAL)
     @allure.description("""
@@ -152,48 +139,15 @@ class TestLogin(BaseTest):
     """)
     def test_logout(self):
         """Test logout functionality."""
-        with allure.step("Login with valid credentials"):
-            self.login_page.login(
-                self.test_data['valid_credentials']['username'],
-                self.test_data['valid_credentials']['password']
-            )
-            allure.attach(
-                self.driver.get_screenshot_as_png(),
-                name="login_for_logout",
-                attachment_type=allure.attachment_type.PNG
-            )
-        
+        self.login_page.login(
+            self.test_data['valid_credentials']['username'],
+            self.test_data['valid_credentials']['password']
+        )
+
         with allure.step("Verify successful login"):
             assert self.login_page.is_login_successful(), "Login was not successful"
-            allure.attach(
-                self.driver.get_screenshot_as_png(),
-                name="login_successful_for_logout",
-                attachment_type=allure.attachment_type.PNG
-            )
-        
-        with allure.step("Perform logout"):
-            self.login_page.logout()
-            allure.attach(
-                self.driver.get_screenshot_as_png(),
-                name="logout_clicked",
-                attachment_type=allure.attachment_type.PNG
-            )
-        
-        with allure.step("Verify successful logout"):
-            assert not self.login_page.is_login_successful(), "Logout was not successful"
-            allure.attach(
-                self.driver.get_screenshot_as_png(),
-                name="logout_successful",
-                attachment_type=allure.attachment_type.PNG
-            )
 
-# Update the driver setup code to include the --user-data-dir option
-chrome_options = Options()
-chrome_options.add_argument('--headless')
-chrome_options.add_argument('--no-sandbox')
-chrome_options.add_argument('--disable-dev-shm-usage')
-chrome_options.add_argument('--disable-gpu')
-chrome_options.add_argument('--disable-notifications')
-chrome_options.add_argument('--window-size=1920,1080')
-chrome_options.add_argument('--remote-debugging-port=0')
-# Removed the --user-data-dir option for CI stability 
\ No newline at end of file
+        self.login_page.logout()
+
+        with allure.step("Verify successful logout"):
+            assert not self.login_page.is_login_successful(), "Logout was not successful"
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Bounded WebDriver pool for reusing browser instances across tests.
+"""
+import queue
+from typing import Callable, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.config import Config
+from utils.logger import logger
+
+
+class DriverPool:
+    """
+    Bounded pool of WebDriver instances.
+
+    Amortizes browser startup across tests and caps the number of
+    concurrent browser processes, which keeps memory stable on CI
+    runners when tests run in parallel.
+    """
+
+    def __init__(self, size: int, factory: Callable[[], WebDriver]):
+        """
+        Initialize the pool and eagerly create its drivers.
+
+        Args:
+            size: Number of drivers to keep in the pool
+            factory: Callable that creates a configured WebDriver
+        """
+        self._queue: "queue.Queue[WebDriver]" = queue.Queue()
+        self._drivers: List[WebDriver] = []
+        for _ in range(size):
+            driver = factory()
+            self._drivers.append(driver)
+            self._queue.put(driver)
+        logger.info(f"Driver pool initialized with {size} driver(s)")
+
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver:
+        """
+        Borrow a driver, blocking until one is free.
+
+        Args:
+            timeout: Optional seconds to wait before raising queue.Empty
+
+        Returns:
+            WebDriver: A pooled driver instance
+        """
+        return self._queue.get(timeout=timeout)
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Return a driver to the pool after resetting its state.
+
+        Cookies and per-origin storage are cleared via CDP so the next
+        borrower starts from a clean slate without a browser restart.
+
+        Args:
+            driver: The driver previously obtained from acquire()
+        """
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {"origin": Config.BASE_URL, "storageTypes": "all"}
+            )
+            driver.get("about:blank")
+        except Exception as e:
+            logger.warning(f"Error resetting pooled driver state: {str(e)}")
+        self._queue.put(driver)
+
+    def shutdown(self) -> None:
+        """Quit every driver owned by the pool."""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Error quitting pooled driver: {str(e)}")
+        self._drivers.clear()
+        logger.info("Driver pool shut down")
@@ -50,9 +50,11 @@ class Logger:
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(file_formatter)
         
-        # Console handler
+        # Console handler; default to WARNING in CI so per-action log
+        # formatting stays off the hot path, overridable via LOG_LEVEL
+        default_level = 'WARNING' if os.environ.get('CI') else 'INFO'
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
+        console_handler.setLevel(os.environ.get('LOG_LEVEL', default_level).upper())
         console_handler.setFormatter(console_formatter)
         
         # Add handlers to logger